@@ -15,6 +15,7 @@ from .saur_client import (
     SaurResponseLastKnow,
     SaurResponseMonthly,
     SaurResponseWeekly,
+    close_shared_session,
 )
 
 __all__ = [
@@ -26,4 +27,5 @@ __all__ = [
     "SaurResponseLastKnow",
     "SaurResponseMonthly",
     "SaurResponseWeekly",
+    "close_shared_session",
 ]
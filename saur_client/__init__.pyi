@@ -9,6 +9,7 @@ from .saur_client import (
     SaurResponseMonthly as SaurResponseMonthly,
     SaurResponseWeekly as SaurResponseWeekly,
     SaurResponseContracts as SaurResponseContracts,
+    close_shared_session as close_shared_session,
 )
 
 __all__: list[str]
@@ -2,12 +2,56 @@
 
 # pylint: disable=E0401
 
+import asyncio
+import base64
+import hashlib
 import json
 import logging
+import random
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Mapping
+from contextlib import suppress
+from email.utils import parsedate_to_datetime
+from functools import lru_cache, partial
+from types import MappingProxyType
 from typing import Any, NewType, override
 
 import aiohttp
 from aiohttp import ClientSession
+from multidict import CIMultiDict
+
+# Décodeur JSON passé à response.json()
+_json_loads: Callable[[str | bytes], Any]
+
+try:
+    # Encodage et décodage JSON plus rapides si orjson est installé
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        """Sérialise obj en JSON (bytes)."""
+        return orjson.dumps(obj)
+
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        """Sérialise obj en JSON (bytes)."""
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+
+try:
+    # Décodage incrémental des grosses réponses si ijson est installé
+    import ijson  # type: ignore[import-untyped]
+except ImportError:
+    ijson = None
+
+
+def _json_serialize(obj: Any) -> str:
+    """Sérialise obj en JSON (str), pour le json_serialize d'aiohttp."""
+    return _json_dumps(obj).decode()
+
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -18,6 +62,48 @@ USER_AGENT = (
     "Mozilla/5.0 (X11; CrOS x86_64 14541.0.0) AppleWebKit/537.36"
     + " (KHTML, like Gecko) Chrome/132.0.0.0 Safari/537.36"
 )
+# Paramètres du pool de connexions (keep-alive) partagé par les requêtes.
+# Toutes les requêtes visent un seul hôte : le pool est borné par hôte et
+# la résolution DNS est mise en cache.
+CONNECTOR_LIMIT = 10
+CONNECTOR_LIMIT_PER_HOST = 10
+CONNECTOR_KEEPALIVE_TIMEOUT = 75
+CONNECTOR_TTL_DNS_CACHE = 300
+# Durée de validité (en secondes) des réponses GET mises en cache
+CACHE_TTL_WEEKLY = 30.0
+CACHE_TTL_MONTHLY = 300.0
+CACHE_TTL_LAST = 15.0
+CACHE_TTL_DELIVERY = 3600.0
+# Nombre maximal de réponses gardées en cache, entrées expirées comprises
+# (conservées avec stale_on_error) ; les plus anciennes sont évincées
+CACHE_MAX_ENTRIES = 64
+# Statuts HTTP déclenchant une ré-authentification
+RETRY_AUTH_STATUSES = frozenset({401, 403})
+# Statuts HTTP transitoires retentés après une attente (backoff)
+RETRY_BACKOFF_STATUSES = frozenset({429, 500, 502, 503, 504})
+# Erreurs de transport retentées après une attente (backoff)
+RETRY_BACKOFF_ERRORS = (TimeoutError, aiohttp.ClientConnectorError)
+# Délai d'attente maximal entre deux tentatives, en secondes
+RETRY_MAX_DELAY = 30.0
+# Délais maximaux d'une requête, par phase : une API SAUR qui ne répond
+# plus ne bloque pas indéfiniment la boucle d'événements de l'appelant
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(
+    total=30, connect=5, sock_connect=5, sock_read=15
+)
+
+# Validité restante minimale (en secondes) pour réutiliser un token en cache
+TOKEN_CACHE_MIN_VALIDITY = 60.0
+# Un token expirant dans moins de TOKEN_REFRESH_MARGIN secondes est
+# renouvelé avant la requête plutôt qu'après un refus 401
+TOKEN_REFRESH_MARGIN = 30.0
+
+# Tokens obtenus dans ce processus :
+# (base_url, login, empreinte du mot de passe)
+#   -> (token, expiration, default_section_id, clientId)
+_TOKEN_CACHE: dict[tuple[str, str, str], tuple[str, float, str, str]] = {}
+# Session partagée par les clients créés avec shared_session=True
+_module_session: ClientSession | None = None
+_module_session_loop: asyncio.AbstractEventLoop | None = None
 
 SaurResponse = dict[str, Any]
 SaurResponseDelivery = NewType("SaurResponseDelivery", SaurResponse)
@@ -30,10 +116,59 @@ SaurResponseContracts = NewType("SaurResponseContracts", SaurResponse)
 class SaurApiError(Exception):
     """Exception personnalisée pour les erreurs de l'API SAUR."""
 
+    def __init__(self, message: str, *, status: int | None = None) -> None:
+        """Initialise l'erreur.
+
+        Args:
+            message: Le message d'erreur.
+            status: Le statut HTTP de la réponse en erreur, s'il y en a.
+        """
+        super().__init__(message)
+        self.status: int | None = status
+
 
 class SaurClient:
     """Client pour interagir avec l'API SAUR."""
 
+    # Pas de __dict__ par instance : moins de mémoire lorsqu'une
+    # intégration crée un client par compteur
+    __slots__ = (
+        "_auth_body",
+        "_auth_lock",
+        "_cache",
+        "_connector",
+        "_contracts_fmt",
+        "_default_section_id",
+        "_delivery_fmt",
+        "_delivery_url_full",
+        "_headers_md",
+        "_inflight",
+        "_keepalive_interval",
+        "_keepalive_task",
+        "_last_fmt",
+        "_last_url_full",
+        "_owns_session",
+        "_shared_session",
+        "_token_cache_key",
+        "_token_expiry",
+        "_token_version",
+        "access_token",
+        "base_url",
+        "clientId",
+        "contracts_url",
+        "delivery_url",
+        "dev_mode",
+        "headers",
+        "last_url",
+        "login",
+        "monthly_url",
+        "password",
+        "session",
+        "stale_on_error",
+        "token_url",
+        "weekly_url",
+    )
+
     token_url: str
     weekly_url: str
     monthly_url: str
@@ -49,6 +184,11 @@ class SaurClient:
         clientId: str = "",
         dev_mode: bool = False,
         token: str = "",
+        session: ClientSession | None = None,
+        connector: aiohttp.BaseConnector | None = None,
+        stale_on_error: bool = False,
+        shared_session: bool = False,
+        keepalive_interval: float | None = None,
     ) -> None:
         """Initialise le client SAUR.
 
@@ -61,94 +201,292 @@ class SaurClient:
                       Par défaut, la valeur est False (environnement
                       de production).
             token: Le token pour économiser un auth().
+            session: Une session aiohttp existante à réutiliser (par
+                     exemple celle de Home Assistant). Elle n'est pas
+                     fermée par le client.
+            connector: Un connecteur aiohttp partagé, utilisé pour la
+                       session créée par le client si `session` n'est
+                       pas fourni. Il n'est pas fermé par le client.
+            stale_on_error: Si True, la dernière réponse connue d'un GET
+                            est renvoyée (même expirée) lorsque l'API
+                            SAUR est en erreur ou injoignable.
+            shared_session: Si True, le client utilise la session du
+                            module, partagée par tous les clients créés
+                            ainsi (voir close_shared_session). Utile
+                            pour des clients de courte durée de vie.
+            keepalive_interval: Si renseigné, une requête HEAD est
+                                envoyée toutes les keepalive_interval
+                                secondes pour garder ouverte la
+                                connexion du pool entre des appels
+                                espacés. Désactivé par défaut.
         """
         self.login: str = login
         self.password: str = password
-        self.access_token: str | None = token
-        self.default_section_id: str = unique_id
+        # Un token vide est normalisé en None (pas encore authentifié)
+        self.access_token: str | None = token or None
         self.clientId: str = clientId
         self.dev_mode: bool = dev_mode
+        self.stale_on_error: bool = stale_on_error
         self.base_url: str = BASE_DEV if self.dev_mode else BASE_SAUR
-        self.headers: dict[str, str] = {
-            "User-Agent": USER_AGENT,
-            "Content-Type": "application/json",
-            "Pragma": "no-cache",
-            "Referer": "https://mon-espace.saurclient.fr/",
-            "Origin": "https://mon-espace.saurclient.fr/",
-        }
+        # Accept-Encoding n'est pas fixé ici : aiohttp annonce déjà
+        # "gzip, deflate" (et "br" si Brotli est installé, voir l'extra
+        # speedups) et décompresse les réponses de façon transparente.
+        # Les headers sont figés : ils sont recopiés une fois pour toutes
+        # dans la session ou dans _headers_md
+        self.headers: Mapping[str, str] = MappingProxyType(
+            {
+                "User-Agent": USER_AGENT,
+                "Content-Type": "application/json",
+                "Pragma": "no-cache",
+                "Referer": "https://mon-espace.saurclient.fr/",
+                "Origin": "https://mon-espace.saurclient.fr/",
+            }
+        )
         self.token_url: str = self.base_url + "/admin/v2/auth"
+        # Gabarits au format % : la chaîne est analysée à chaque appel de
+        # str.format, alors que % avec un tuple est nettement plus rapide
         self.weekly_url: str = (
             self.base_url
-            + "/deli/section_subscription/{default_section_id}/"
-            + "consumptions/weekly?year={year}&month={month}&day={day}"
+            + "/deli/section_subscription/%s/"
+            + "consumptions/weekly?year=%d&month=%d&day=%d"
         )
         self.monthly_url: str = (
             self.base_url
-            + "/deli/section_subscription/{default_section_id}/"
-            + "consumptions/monthly?year={year}&month={month}"
+            + "/deli/section_subscription/%s/"
+            + "consumptions/monthly?year=%d&month=%d"
         )
         self.last_url: str = (
-            self.base_url
-            + "/deli/section_subscriptions/{default_section_id}"
-            + "/meter_indexes/last"
+            self.base_url + "/deli/section_subscriptions/%s/meter_indexes/last"
         )
         self.delivery_url: str = (
-            self.base_url
-            + "/deli/section_subscriptions/{default_section_id}/"
-            + "delivery_points"
+            self.base_url + "/deli/section_subscriptions/%s/delivery_points"
         )
         self.contracts_url: str = (
-            self.base_url + "/admin/users/v2/website_areas/{clientId}"
+            self.base_url + "/admin/users/v2/website_areas/%s"
         )
+        # Formateurs liés, précalculés une fois pour toutes ; les URL
+        # hebdomadaires et mensuelles passent par _fmt_weekly/_fmt_monthly
+        self._last_fmt: Callable[[Any], str] = self.last_url.__mod__
+        self._delivery_fmt: Callable[[Any], str] = self.delivery_url.__mod__
+        self._contracts_fmt: Callable[[Any], str] = self.contracts_url.__mod__
+        # Résout aussi les URL complètes de last et delivery (voir setter)
+        self.default_section_id = unique_id
+        # Expiration du token (claim exp du JWT), si elle est connue
+        self._token_expiry: float | None = _jwt_expiry(token) if token else None
+        # Le mot de passe fait partie de la clé : un autre client avec le
+        # même login mais un mauvais mot de passe n'hérite pas du token
+        self._token_cache_key: tuple[str, str, str] = (
+            self.base_url,
+            login,
+            hashlib.sha256(password.encode()).hexdigest(),
+        )
+        if not token:
+            self._load_cached_token()
+        # Le mot de passe n'est jamais journalisé
         _LOGGER.debug(
-            "Login %s Password %s, unique_id %s, dev_mode %s",
+            "SaurClient créé pour login=%s, unique_id=%s, dev_mode=%s",
             login,
-            password,
             unique_id,
             dev_mode,
         )
-        # Initialisation de la session dès le __init__
-        self.session: ClientSession = ClientSession()
+        # Sans session fournie, elle est créée à la première requête
+        # (voir _get_session) et fermée par aclose()
+        self.session: ClientSession | None = session
+        self._connector: aiohttp.BaseConnector | None = connector
+        self._shared_session: bool = session is None and shared_session
+        self._owns_session: bool = session is None and not shared_session
+        self._keepalive_interval: float | None = keepalive_interval
+        self._keepalive_task: asyncio.Task[None] | None = None
+        # Headers prêts à l'emploi, déjà sous la forme CIMultiDict utilisée
+        # par aiohttp ; l'en-tête Authorization est mis à jour sur place
+        # à chaque changement de token
+        self._headers_md: CIMultiDict[str] = CIMultiDict(
+            self._base_request_headers()
+        )
+        self._update_auth_headers()
+        # Le corps de l'authentification ne dépend que de login/password :
+        # il est sérialisé une seule fois
+        self._auth_body: bytes = _json_dumps(
+            _build_auth_payload(login, password)
+        )
+        # Évite plusieurs authentifications simultanées
+        self._auth_lock: asyncio.Lock = asyncio.Lock()
+        # Incrémenté à chaque authentification réussie
+        self._token_version: int = 0
+        # Requêtes GET en cours, pour regrouper les appels identiques
+        self._inflight: dict[str, asyncio.Task[SaurResponse]] = {}
+        # Cache des réponses GET : url -> (date d'expiration, réponse
+        # sérialisée) ; des bytes immuables, jamais modifiés par un appelant
+        self._cache: dict[str, tuple[float, bytes]] = {}
+
+    @property
+    def default_section_id(self) -> str:
+        """L'identifiant du compteur utilisé par défaut."""
+        return self._default_section_id
+
+    @default_section_id.setter
+    def default_section_id(self, value: str) -> None:
+        # Les URL qui ne dépendent que du compteur sont résolues une seule
+        # fois, à chaque changement d'identifiant
+        self._default_section_id = value
+        self._last_url_full: str = self._last_fmt((value,))
+        self._delivery_url_full: str = self._delivery_fmt((value,))
+
+    def _load_cached_token(self) -> None:
+        """Reprend un token encore valide obtenu pour le même compte."""
+        cached = _TOKEN_CACHE.get(self._token_cache_key)
+        if cached is None:
+            return
+        token, expiry, section_id, client_id = cached
+        if expiry - time.time() <= TOKEN_CACHE_MIN_VALIDITY:
+            return
+        self.access_token = token
+        self._token_expiry = expiry
+        if not self.default_section_id:
+            self.default_section_id = section_id
+        if not self.clientId:
+            self.clientId = client_id
+        _LOGGER.debug("Token repris du cache pour %s", self.login)
+
+    async def _get_session(self) -> ClientSession:
+        """Retourne la session aiohttp, en la créant si nécessaire.
+
+        La même session (et donc le même pool de connexions keep-alive)
+        est utilisée pour l'authentification et pour les requêtes.
+        Les headers communs sont portés par la session ; seul
+        l'en-tête Authorization est ajouté à chaque requête.
+        Une session fournie par l'appelant est toujours retournée telle
+        quelle ; avec shared_session, c'est la session du module.
+        """
+        if self._keepalive_interval is not None and (
+            self._keepalive_task is None or self._keepalive_task.done()
+        ):
+            self._keepalive_task = asyncio.create_task(
+                self._keepalive_loop(self._keepalive_interval)
+            )
+
+        if self._shared_session:
+            self.session = await _get_shared_session()
+            return self.session
+
+        if self.session is not None and (
+            not self._owns_session or not self.session.closed
+        ):
+            return self.session
+
+        connector: aiohttp.BaseConnector = (
+            self._connector if self._connector is not None else _new_connector()
+        )
+        self.session = ClientSession(
+            connector=connector,
+            connector_owner=self._connector is None,
+            headers=self.headers,
+            json_serialize=_json_serialize,
+        )
+        return self.session
+
+    async def _keepalive_loop(self, interval: float) -> None:
+        """Garde la connexion du pool ouverte entre des appels espacés.
+
+        Sans trafic, la connexion keep-alive finit par être fermée et la
+        requête suivante refait une poignée de main TLS complète. Une
+        requête HEAD légère est donc envoyée à intervalle régulier, tant
+        que le client est authentifié. La tâche est annulée par aclose(),
+        et s'arrête d'elle-même si la session a été fermée.
+        """
+        while True:
+            await asyncio.sleep(interval)
+            if self.session is None or self.session.closed:
+                return
+            if self.access_token is None:
+                continue
+            try:
+                async with self.session.head(
+                    self.base_url,
+                    headers=self._headers_md,
+                    timeout=REQUEST_TIMEOUT,
+                ):
+                    pass
+            except (aiohttp.ClientError, TimeoutError) as err:
+                _LOGGER.debug("Keep-alive vers %s : %s", self.base_url, err)
+
+    def _base_request_headers(self) -> dict[str, str]:
+        """Retourne les headers à envoyer avec chaque requête.
+
+        Une session fournie par l'appelant ne porte pas les headers
+        communs du client : ils sont alors ajoutés à chaque requête.
+        """
+        return {} if self._owns_session else dict(self.headers)
+
+    def _update_auth_headers(self) -> None:
+        """Met à jour l'en-tête Authorization pour le token courant."""
+        if self.access_token:
+            self._headers_md["Authorization"] = f"Bearer {self.access_token}"
+        else:
+            self._headers_md.popall("Authorization", None)
+
+    def _store_token(
+        self, access_token: str, section_id: str, client_id: str
+    ) -> None:
+        """Enregistre un nouveau token et les identifiants associés.
+
+        L'en-tête Authorization est mis à jour, et le token est gardé en
+        cache pour les clients suivants si son expiration est lisible.
+        """
+        self.access_token = access_token
+        self.default_section_id = section_id
+        self.clientId = client_id
+        self._token_version += 1
+        self._update_auth_headers()
+        self._token_expiry = _jwt_expiry(access_token)
+        if self._token_expiry is not None:
+            _TOKEN_CACHE[self._token_cache_key] = (
+                access_token,
+                self._token_expiry,
+                section_id,
+                client_id,
+            )
 
     async def _authenticate(self) -> None:
         """Authentifie le client"""
 
         """
         Authentifie et récupère les informations.
-        Fonction interne.
+        Fonction interne : à appeler sous self._auth_lock, via
+        _ensure_authenticated ou _refresh_token, pour qu'un seul POST
+        d'authentification soit émis par renouvellement de token.
         """
 
-        headers: dict[str, str] = (
-            self.headers.copy()
-        )  # On utilise les headers de base, sans Authorization
-
-        # Utilisation de _build_auth_payload pour construire le payload
-        payload: dict[str, Any] = _build_auth_payload(
-            self.login, self.password
-        )
+        # Les headers de base, sans Authorization ; le corps étant déjà
+        # sérialisé, le Content-Type est précisé explicitement
+        headers: dict[str, str] = self._base_request_headers()
+        headers["Content-Type"] = "application/json"
 
+        # Le corps contient le mot de passe : il n'est pas journalisé
         _LOGGER.debug(
-            "Authenticating to %s, payload: %s, headers: %s",
-            self.token_url,
-            payload,
-            headers,
+            "Authenticating to %s, headers: %s", self.token_url, headers
         )
 
         try:
             # Utilisation de _execute_http_request pour effectuer la requête
+            session: ClientSession = await self._get_session()
             data: dict[str, Any] = await _execute_http_request(
-                self.session, "POST", self.token_url, headers, payload
+                session,
+                "POST",
+                self.token_url,
+                headers,
+                payload=self._auth_body,
             )
 
             # Appel à la fonction de traitement de la réponse
-            _process_auth_response(self, data)
+            self._process_auth_response(data)
 
         except aiohttp.ClientResponseError as err:
             message = (
-                "Erreur API SAUR lors de l'authentification ({self.token_url})"
+                f"Erreur API SAUR lors de l'authentification ({self.token_url})"
                 f": status: {err.status}, message: {err.message}"
             )
-            raise SaurApiError(message) from err
+            raise SaurApiError(message, status=err.status) from err
         except aiohttp.ClientError as err:
             message = (
                 "Erreur API SAUR lors de l'authentification "
@@ -162,6 +500,108 @@ class SaurClient:
             )
             raise SaurApiError(message) from err
 
+    def _process_auth_response(self, data: dict[str, Any]) -> None:
+        """Traite la réponse d'authentification et
+        met à jour l'état du client."""
+        # Chaque clé n'est lue qu'une fois, puis validée avant affectation
+        token_info: dict[str, Any] = data.get("token") or {}
+        access_token: str | None = token_info.get("access_token")
+        section_id: Any = data.get("defaultSectionId")
+        if access_token and section_id:
+            self._store_token(
+                access_token, str(section_id), str(data.get("clientId"))
+            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Authentification réussie. Réponse: %s",
+                    # JSON formaté avec indentation
+                    json.dumps(data, indent=2),
+                )
+        else:
+            _LOGGER.error("Réponse d'authentification invalide : %s", data)
+            raise SaurApiError(
+                "L'authentification a échoué : données invalides."
+            )
+
+    async def _ensure_authenticated(self) -> None:
+        """Authentifie le client une seule fois si nécessaire.
+
+        Le verrou garantit qu'une seule authentification est lancée
+        lorsque plusieurs requêtes concurrentes démarrent sans token.
+        """
+        if self.access_token and self.default_section_id:
+            return
+        async with self._auth_lock:
+            if not self.access_token or not self.default_section_id:
+                await self._authenticate()
+
+    async def _ensure_default_section_id(self) -> None:
+        """Authentifie le client si son compteur par défaut est inconnu.
+
+        Un client créé avec un token mais sans unique_id construirait
+        sinon des URL sans identifiant de compteur, refusées en 404.
+        """
+        if not self.default_section_id:
+            await self._ensure_authenticated()
+
+    async def _ensure_client_id(self) -> None:
+        """Authentifie le client une seule fois si clientId est inconnu.
+
+        Seule la réponse d'authentification donne le clientId : un token
+        valide sans clientId (repris du cache ou fourni par l'appelant)
+        ne suffit pas. Le clientId est revérifié sous le verrou, pour
+        qu'une authentification concurrente ne soit pas répétée.
+        """
+        if self.clientId:
+            return
+        async with self._auth_lock:
+            if not self.clientId:
+                await self._authenticate()
+
+    async def _ensure_fresh_token(self) -> None:
+        """Prépare le token avant l'envoi d'une requête.
+
+        Sans token, le client s'authentifie ; un token sur le point
+        d'expirer est renouvelé avant la requête. Un token invalide est
+        géré par la ré-authentification sur 401/403.
+        """
+        if self.access_token is None:
+            await self._ensure_authenticated()
+        elif (
+            self._token_expiry is not None
+            and self._token_expiry - time.time() < TOKEN_REFRESH_MARGIN
+        ):
+            await self._refresh_token(self._token_version)
+
+    def _invalidate_token(self, token_version: int) -> None:
+        """Oublie un token refusé par l'API.
+
+        Sans effet si le token a déjà été renouvelé par une requête
+        concurrente.
+
+        Args:
+            token_version: La version du token refusé.
+        """
+        if self._token_version == token_version:
+            self.access_token = None
+            self._update_auth_headers()
+            _TOKEN_CACHE.pop(self._token_cache_key, None)
+
+    async def _refresh_token(self, token_version: int) -> None:
+        """Renouvelle le token, une seule fois par version de token.
+
+        Si plusieurs requêtes concurrentes demandent le renouvellement
+        du même token, les suivantes attendent le verrou puis
+        réutilisent le nouveau token.
+
+        Args:
+            token_version: La version du token à remplacer.
+        """
+        async with self._auth_lock:
+            if self._token_version == token_version:
+                self.access_token = None
+                await self._authenticate()
+
     async def _async_request(
         self,
         method: str,
@@ -172,6 +612,50 @@ class SaurClient:
     ) -> SaurResponse:
         """Fonction générique pour les requêtes HTTP avec ré-auth.
 
+        Les requêtes GET identiques lancées simultanément sont
+        regroupées : une seule requête HTTP est émise et tous les
+        appelants en reçoivent le résultat. Voir _send_request pour
+        les arguments.
+        """
+        if method != "GET":
+            return await self._send_request(
+                method, url, payload, max_retries, backoff_factor
+            )
+
+        task: asyncio.Task[SaurResponse] | None = self._inflight.get(url)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._send_request(
+                    method, url, payload, max_retries, backoff_factor
+                )
+            )
+            self._inflight[url] = task
+            task.add_done_callback(partial(self._forget_inflight, url))
+        # shield : l'annulation d'un appelant n'annule pas la requête
+        # partagée avec les autres
+        return await asyncio.shield(task)
+
+    def _forget_inflight(
+        self, url: str, task: "asyncio.Task[SaurResponse]"
+    ) -> None:
+        """Retire une requête terminée de la table des requêtes en cours."""
+        if self._inflight.get(url) is task:
+            del self._inflight[url]
+        # Évite l'avertissement « exception was never retrieved » si
+        # tous les appelants ont été annulés
+        if not task.cancelled():
+            task.exception()
+
+    async def _send_request(
+        self,
+        method: str,
+        url: str,
+        payload: dict[str, Any] | None = None,
+        max_retries: int = 3,
+        backoff_factor: float = 2,
+    ) -> SaurResponse:
+        """Envoie une requête HTTP avec ré-auth et nouvelles tentatives.
+
         Args:
             method: La méthode HTTP à utiliser (GET, POST, etc.).
             url: L'URL de l'API à interroger.
@@ -190,37 +674,51 @@ class SaurClient:
                           y compris après tentative de ré-authentification.
         """
 
-        headers: dict[str, str] = self.headers.copy()
-        if self.access_token:
-            headers["Authorization"] = f"Bearer {self.access_token}"
-
-        # Version sécurisée des headers pour le logging
-        safe_headers: dict[str, str] = {k: str(v) for k, v in headers.items()}
-
-        _LOGGER.debug(
-            "Request %s to %s, payload: %s, headers: %s",
-            method,
-            url,
-            payload,
-            safe_headers,
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            # Version sécurisée des headers pour le logging
+            safe_headers: dict[str, str] = {
+                k: str(v) for k, v in self._headers_md.items()
+            }
+            _LOGGER.debug(
+                "Request %s to %s, payload: %s, headers: %s",
+                method,
+                url,
+                payload,
+                safe_headers,
+            )
 
         for attempt in range(max_retries + 1):
-            # On vérifie ici que le token et l'ID sont définis
-            if not self.access_token or not self.default_section_id:
-                await self._authenticate()
-                headers["Authorization"] = f"Bearer {self.access_token}"
-
+            token_version: int = self._token_version
+            authenticated: bool = False
             try:
+                # Dans le try : une authentification en échec transitoire
+                # (429, 5xx, délai dépassé) est retentée comme la requête
+                await self._ensure_fresh_token()
+                authenticated = True
+
+                # Version du token utilisé pour cette tentative ; les
+                # headers ne sont pas modifiés par aiohttp et sont
+                # partagés tels quels
+                token_version = self._token_version
+                headers: CIMultiDict[str] = self._headers_md
+                session: ClientSession = await self._get_session()
                 data: SaurResponse = await _execute_http_request(
-                    self.session, method, url, headers, payload
+                    session, method, url, headers, payload=payload
                 )
                 return data
 
             except SaurApiError as err:
+                # Un refus 401/403 de l'authentification elle-même
+                # (identifiants invalides) n'est pas retenté
+                if not authenticated and err.status in RETRY_AUTH_STATUSES:
+                    raise
                 # Tentative de ré-authentification
-                if not await _retry_authentication(
-                    self, err, attempt, max_retries, headers
+                if not await self._retry_authentication(
+                    err,
+                    attempt,
+                    max_retries,
+                    token_version,
+                    backoff_factor=backoff_factor,
                 ):
                     # Si _retry_authentication retourne False (ou lève une
                     # exception), on propage l'erreur
@@ -231,19 +729,200 @@ class SaurClient:
                 (incluant la ré-authentification)."""
         )
 
+    async def _retry_authentication(
+        self,
+        err: SaurApiError,
+        attempt: int,
+        max_retries: int,
+        token_version: int,
+        *,
+        backoff_factor: float = 2,
+    ) -> bool:
+        """Gère les nouvelles tentatives après une erreur de l'API.
+
+        En cas d'erreur 401 ou 403, le token refusé est oublié et la
+        tentative suivante se ré-authentifie. Si plusieurs requêtes
+        concurrentes échouent avec le même token, une seule
+        ré-authentification est effectuée : les autres attendent le
+        verrou puis réutilisent le nouveau token.
+        En cas d'erreur transitoire (429, 5xx, délai dépassé, échec de
+        connexion), la requête est retentée après une attente exponentielle
+        (voir _retry_delay).
+
+        Args:
+            err: L'exception SaurApiError à gérer.
+            attempt: Le numéro de la tentative actuelle.
+            max_retries: Le nombre maximum de tentatives.
+            token_version: La version du token utilisé par la requête
+                           en échec.
+            backoff_factor: Le facteur d'augmentation du délai entre
+                            chaque tentative.
+
+        Returns:
+            True si la requête peut être retentée, False sinon.
+
+        Raises:
+            SaurApiError: Si le nombre maximum de tentatives est atteint
+            ou si l'erreur n'est pas retentable.
+        """
+        if err.status in RETRY_AUTH_STATUSES:
+            if attempt < max_retries:
+                _LOGGER.debug(
+                    "Réponse %s, tentative de ré-authentification"
+                    "(tentative %s/%s).",
+                    err,
+                    attempt + 1,
+                    max_retries,
+                )
+                # La ré-authentification est faite par la tentative
+                # suivante, dans le try de _send_request
+                self._invalidate_token(token_version)
+
+                return True  # Indique que la requête peut être retentée
+            else:
+                _LOGGER.error(
+                    "Réponse %s, nombre maximum de tentatives de "
+                    "ré-authentification atteint.",
+                    err,
+                )
+                raise SaurApiError(
+                    "Nombre maximum de tentatives de "
+                    f"ré-authentification atteint:{err}",
+                    status=err.status,
+                ) from err
+
+        # Les délais dépassés et les échecs de connexion sont traités comme
+        # des erreurs transitoires ; les autres erreurs (400, 404, ...) sont
+        # relevées immédiatement, sans nouvelle tentative
+        if err.status in RETRY_BACKOFF_STATUSES or isinstance(
+            err.__cause__, RETRY_BACKOFF_ERRORS
+        ):
+            if attempt < max_retries:
+                delay: float = _retry_delay(err, attempt, backoff_factor)
+                _LOGGER.debug(
+                    "Réponse %s, nouvelle tentative dans %.2f s "
+                    "(tentative %s/%s).",
+                    err,
+                    delay,
+                    attempt + 1,
+                    max_retries,
+                )
+                await asyncio.sleep(delay)
+                return True
+            _LOGGER.error(
+                "Réponse %s, nombre maximum de tentatives atteint.", err
+            )
+            raise SaurApiError(
+                f"Nombre maximum de tentatives atteint: {err}",
+                status=err.status,
+            ) from err
+
+        raise err  # On relève l'erreur si elle n'est pas retentable
+
+    async def _with_auth_backoff(
+        self,
+        ensure: Callable[[], Awaitable[None]],
+        max_retries: int = 3,
+        backoff_factor: float = 2,
+    ) -> None:
+        """Exécute une authentification préalable avec backoff.
+
+        Sert aux authentifications faites avant de construire l'URL
+        d'une requête (compteur ou clientId inconnu), hors de la boucle
+        de _send_request. Une erreur transitoire est retentée après une
+        attente exponentielle ; un refus 401/403 (identifiants invalides)
+        est relevé immédiatement.
+
+        Args:
+            ensure: La coroutine d'authentification à exécuter.
+            max_retries: Le nombre maximum de nouvelles tentatives.
+            backoff_factor: Le facteur d'augmentation du délai entre
+                    chaque tentative.
+        """
+        for attempt in range(max_retries + 1):
+            try:
+                await ensure()
+                return
+            except SaurApiError as err:
+                if err.status in RETRY_AUTH_STATUSES:
+                    raise
+                if not await self._retry_authentication(
+                    err,
+                    attempt,
+                    max_retries,
+                    self._token_version,
+                    backoff_factor=backoff_factor,
+                ):
+                    raise
+
+    async def _cached_get(self, url: str, ttl: float) -> SaurResponse:
+        """Effectue une requête GET en utilisant le cache mémoire.
+
+        Args:
+            url: L'URL complète de l'API à interroger (clé du cache).
+            ttl: La durée de validité de la réponse, en secondes.
+
+        Returns:
+            La réponse en cache si elle est encore valide, sinon la
+            réponse de l'API (qui est alors mise en cache).
+            Avec stale_on_error, la dernière réponse connue est renvoyée
+            si l'API est en erreur.
+            Le cache conserve la réponse sérialisée : chaque appel reçoit
+            son propre dictionnaire, et le modifier n'altère pas le cache.
+
+        Raises:
+            SaurApiError: En cas d'erreur de l'API, si aucune réponse
+                          de repli n'est disponible.
+        """
+        entry: tuple[float, bytes] | None = self._cache.get(url)
+        if entry is not None:
+            expires_at, cached = entry
+            if time.monotonic() < expires_at:
+                _LOGGER.debug("Cache hit for %s", url)
+                hit: SaurResponse = _json_loads(cached)
+                return hit
+            # Les entrées expirées sont conservées pour servir de repli
+            if not self.stale_on_error:
+                del self._cache[url]
+
+        try:
+            data: SaurResponse = await self._async_request(
+                method="GET", url=url
+            )
+        except SaurApiError:
+            stale: tuple[float, bytes] | None = self._cache.get(url)
+            if not self.stale_on_error or stale is None:
+                raise
+            _LOGGER.warning("serving stale response for %s", url)
+            fallback: SaurResponse = _json_loads(stale[1])
+            return fallback
+
+        # Réinsérée en fin de dictionnaire : l'ordre d'insertion est
+        # l'ordre d'éviction. Les URL incluent l'année, le mois et le
+        # jour ; sans borne, un client qui interroge l'API en continu
+        # accumulerait indéfiniment les réponses expirées
+        self._cache.pop(url, None)
+        self._cache[url] = (time.monotonic() + ttl, _json_dumps(data))
+        while len(self._cache) > CACHE_MAX_ENTRIES:
+            del self._cache[next(iter(self._cache))]
+        return data
+
+    def bust_cache(self) -> None:
+        """Vide le cache des réponses GET."""
+        self._cache.clear()
+
     async def get_weekly_data(
         self, year: int, month: int, day: int, section_id: str | None = None
     ) -> SaurResponseWeekly:
         """Récupère les données hebdomadaires."""
+        if not section_id:
+            await self._with_auth_backoff(self._ensure_default_section_id)
         used_section_id = section_id if section_id else self.default_section_id
 
-        url: str = self.weekly_url.format(
-            default_section_id=used_section_id,
-            year=year,
-            month=month,
-            day=day,
+        url: str = _fmt_weekly(
+            self.weekly_url, used_section_id, year, month, day
         )
-        data: SaurResponse = await self._async_request(method="GET", url=url)
+        data: SaurResponse = await self._cached_get(url, CACHE_TTL_WEEKLY)
         response: SaurResponseWeekly = SaurResponseWeekly(data)
         return response
 
@@ -251,12 +930,12 @@ class SaurClient:
         self, year: int, month: int, section_id: str | None = None
     ) -> SaurResponseMonthly:
         """Récupère les données mensuelles."""
+        if not section_id:
+            await self._with_auth_backoff(self._ensure_default_section_id)
         used_section_id = section_id if section_id else self.default_section_id
 
-        url: str = self.monthly_url.format(
-            default_section_id=used_section_id, year=year, month=month
-        )
-        data: SaurResponse = await self._async_request(method="GET", url=url)
+        url: str = _fmt_monthly(self.monthly_url, used_section_id, year, month)
+        data: SaurResponse = await self._cached_get(url, CACHE_TTL_MONTHLY)
         response: SaurResponseMonthly = SaurResponseMonthly(data)
         return response
 
@@ -264,10 +943,12 @@ class SaurClient:
         self, section_id: str | None = None
     ) -> SaurResponseLastKnow:
         """Récupère les dernières données connues."""
-        used_section_id = section_id if section_id else self.default_section_id
-
-        url: str = self.last_url.format(default_section_id=used_section_id)
-        data: SaurResponse = await self._async_request(method="GET", url=url)
+        if not section_id:
+            await self._with_auth_backoff(self._ensure_default_section_id)
+        url: str = (
+            self._last_fmt((section_id,)) if section_id else self._last_url_full
+        )
+        data: SaurResponse = await self._cached_get(url, CACHE_TTL_LAST)
         response: SaurResponseLastKnow = SaurResponseLastKnow(data)
         return response
 
@@ -275,86 +956,318 @@ class SaurClient:
         self, section_id: str | None = None
     ) -> SaurResponseDelivery:
         """Récupère les points de livraison."""
-        # Utilise section_id si fourni, sinon utilise self.default_section_id
-        sectionid = section_id if section_id else self.default_section_id
-
-        # Authentification si sectionid est None/vide
-        if not sectionid:
-            await self._authenticate()
-            sectionid = self.default_section_id
-
-        url: str = self.delivery_url.format(default_section_id=sectionid)
-        data: SaurResponse = await self._async_request(method="GET", url=url)
+        if not section_id:
+            await self._with_auth_backoff(self._ensure_default_section_id)
+        url: str = (
+            self._delivery_fmt((section_id,))
+            if section_id
+            else self._delivery_url_full
+        )
+        data: SaurResponse = await self._cached_get(url, CACHE_TTL_DELIVERY)
         response: SaurResponseDelivery = SaurResponseDelivery(data)
         return response
 
+    async def fetch_all(
+        self, year: int, month: int, day: int, section_id: str | None = None
+    ) -> dict[str, SaurResponse | BaseException]:
+        """Récupère en parallèle les quatre jeux de données de lecture.
+
+        Les requêtes hebdomadaire, mensuelle, dernier index et points de
+        livraison sont lancées simultanément sur le pool de connexions.
+
+        Args:
+            year: L'année des données hebdomadaires et mensuelles.
+            month: Le mois des données hebdomadaires et mensuelles.
+            day: Le jour des données hebdomadaires.
+            section_id: L'identifiant du compteur (par défaut celui
+                        du client).
+
+        Returns:
+            Un dictionnaire avec les clés "weekly", "monthly", "last" et
+            "delivery". Une requête en échec y figure sous la forme de
+            l'exception levée, sans interrompre les autres.
+        """
+        # Une seule authentification avant de lancer les requêtes
+        await self._with_auth_backoff(self._ensure_authenticated)
+
+        # Quatre requêtes au plus : elles tiennent dans le pool de
+        # connexions (CONNECTOR_LIMIT_PER_HOST), sans limite à ajouter
+        results: tuple[
+            SaurResponse | BaseException, ...
+        ] = await asyncio.gather(
+            self.get_weekly_data(year, month, day, section_id),
+            self.get_monthly_data(year, month, section_id),
+            self.get_lastknown_data(section_id),
+            self.get_deliverypoints_data(section_id),
+            return_exceptions=True,
+        )
+        return dict(
+            zip(("weekly", "monthly", "last", "delivery"), results, strict=True)
+        )
+
     async def get_contracts(self) -> SaurResponseContracts:
         """Récupère les points de livraison."""
-        # Authentification si default_section_id n'est pas défini
-        if not self.clientId:
-            await self._authenticate()
+        await self._with_auth_backoff(self._ensure_client_id)
 
-        url: str = self.contracts_url.format(clientId=self.clientId)
+        url: str = self._contracts_fmt((self.clientId,))
         data: SaurResponse = await self._async_request(method="GET", url=url)
         response: SaurResponseContracts = SaurResponseContracts(data)
         return response
 
+    async def iter_contract_clients(
+        self, max_retries: int = 3, backoff_factor: float = 2
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Itère sur les clients de la réponse des contrats.
+
+        Avec ijson, la réponse est décodée au fil de sa réception et
+        seuls les clients sont construits, un par un. Sans ijson, la
+        réponse est lue via get_contracts().
+
+        Les erreurs survenues avant le premier client sont retentées
+        comme dans _send_request : ré-authentification sur 401/403,
+        attente exponentielle sur 429, 5xx, délai dépassé ou échec de
+        connexion. Une fois la lecture commencée, une erreur est relevée
+        telle quelle. Ce chemin ne passe ni par le cache (pas de repli
+        stale_on_error) ni par le regroupement des requêtes identiques.
+
+        Args:
+            max_retries: Le nombre maximum de nouvelles tentatives.
+            backoff_factor: Le facteur d'augmentation du délai entre
+                    chaque tentative.
+        """
+        if ijson is None:
+            contracts: SaurResponseContracts = await self.get_contracts()
+            for client in contracts.get("clients", ()):
+                yield client
+            return
+
+        for attempt in range(max_retries + 1):
+            token_version: int = self._token_version
+            authenticated: bool = False
+            started: bool = False
+            try:
+                await self._ensure_fresh_token()
+                await self._ensure_client_id()
+                authenticated = True
+
+                token_version = self._token_version
+                url: str = self._contracts_fmt((self.clientId,))
+                session: ClientSession = await self._get_session()
+                async for client in _stream_json_items(
+                    session, url, self._headers_md, "clients.item"
+                ):
+                    started = True
+                    yield client
+                return
+            except SaurApiError as err:
+                # Une lecture commencée ne peut pas reprendre ; un refus
+                # de l'authentification elle-même n'est pas retenté
+                if started or (
+                    not authenticated and err.status in RETRY_AUTH_STATUSES
+                ):
+                    raise
+                if not await self._retry_authentication(
+                    err,
+                    attempt,
+                    max_retries,
+                    token_version,
+                    backoff_factor=backoff_factor,
+                ):
+                    raise
+
+    async def aclose(self) -> None:
+        """Ferme la session aiohttp et son pool de connexions.
+
+        Une session fournie par l'appelant n'est pas fermée.
+        """
+        task: asyncio.Task[None] | None = self._keepalive_task
+        if task is not None:
+            self._keepalive_task = None
+            task.cancel()
+            # Une tâche déjà terminée en erreur ne fait pas échouer la
+            # fermeture du client
+            with suppress(asyncio.CancelledError, Exception):
+                await task
+        if self._owns_session and self.session is not None:
+            await self.session.close()
+            self.session = None
+
     async def close_session(self) -> None:
         """Ferme la session aiohttp."""
-        await self.__aexit__(None, None, None)
+        await self.aclose()
 
-    async def __aenter__(self):
+    async def __aenter__(self) -> "SaurClient":
         """Initialise la session aiohttp si nécessaire."""
-        # La session est déjà initialisée dans __init__
+        await self._get_session()
         return self
 
     async def __aexit__(
         self, exc_type: None, exc_val: None, exc_tb: None
     ) -> None:
         """Ferme la session aiohttp."""
-        if self.session:
-            await self.session.close()
-            # self.session = None
+        await self.aclose()
+
+
+def _new_connector() -> aiohttp.TCPConnector:
+    """Crée un connecteur réglé pour l'hôte unique de l'API SAUR."""
+    return aiohttp.TCPConnector(
+        limit=CONNECTOR_LIMIT,
+        limit_per_host=CONNECTOR_LIMIT_PER_HOST,
+        ttl_dns_cache=CONNECTOR_TTL_DNS_CACHE,
+        keepalive_timeout=CONNECTOR_KEEPALIVE_TIMEOUT,
+    )
+
+
+async def _get_shared_session() -> ClientSession:
+    """Retourne la session du module, en la créant si nécessaire.
+
+    Elle est recréée si elle a été fermée ou si elle appartient à une
+    autre boucle d'événements (par exemple après un nouvel asyncio.run) ;
+    dans ce dernier cas, l'ancienne session est fermée au passage.
+    """
+    global _module_session, _module_session_loop
+    loop = asyncio.get_running_loop()
+    if _module_session is not None and _module_session_loop is not loop:
+        # La fermeture du connecteur est synchrone : elle reste possible
+        # depuis la nouvelle boucle, même si l'ancienne est terminée
+        await _module_session.close()
+        _module_session = None
+    if _module_session is None or _module_session.closed:
+        _module_session = ClientSession(
+            connector=_new_connector(), json_serialize=_json_serialize
+        )
+        _module_session_loop = loop
+    return _module_session
+
+
+async def close_shared_session() -> None:
+    """Ferme la session partagée par les clients créés avec
+    shared_session=True."""
+    global _module_session, _module_session_loop
+    if _module_session is not None:
+        await _module_session.close()
+    _module_session = None
+    _module_session_loop = None
 
 
 async def _execute_http_request(
     session: aiohttp.ClientSession,
     method: str,
     url: str,
-    headers: dict[str, str],
-    payload: dict[str, Any] | None = None,
+    headers: Mapping[str, str],
+    *,
+    payload: dict[str, Any] | bytes | None = None,
 ) -> dict[str, Any]:
-    """Exécute la requête HTTP et gère les erreurs HTTP."""
+    """Exécute la requête HTTP et gère les erreurs HTTP.
+
+    Le corps `payload` est soit un dictionnaire (sérialisé par aiohttp),
+    soit des bytes déjà sérialisés, envoyés tels quels.
+    """
+    json_payload: dict[str, Any] | None = None
+    body: bytes | None = None
+    if isinstance(payload, bytes):
+        body = payload
+    else:
+        json_payload = payload
     try:
-        async with session.request(
-            method, url, json=payload, headers=headers
-        ) as response:
+        # Le corps est entièrement lu par response.json() : un simple
+        # release() suffit, sans gestionnaire de contexte asynchrone
+        response: aiohttp.ClientResponse = await session.request(
+            method,
+            url,
+            json=json_payload,
+            data=body,
+            headers=headers,
+            timeout=REQUEST_TIMEOUT,
+        )
+        try:
             response.raise_for_status()
-            # data: dict[str, Any] = await response.json()
-            data: dict[str, Any] | list[Any] = await response.json()
+            data: dict[str, Any] | list[Any] = await response.json(
+                loads=_json_loads, content_type=None
+            )
+        finally:
+            response.release()
 
-            if not isinstance(data, dict):
-                raise SaurApiError(
-                    f"""Réponse JSON inattendue : le type doit
-                    être un dictionnaire, mais c'est {type(data)}"""
-                )
+        if not isinstance(data, dict):
+            raise SaurApiError(
+                f"""Réponse JSON inattendue : le type doit
+                être un dictionnaire, mais c'est {type(data)}"""
+            )
 
-            data_dict: SaurResponse = data
-            _LOGGER.debug(f"Response from {url}: {data_dict}")
-            return data_dict
+        data_dict: SaurResponse = data
+        # Le corps complet n'est passé au logger que si DEBUG est actif
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Response from %s: %s", url, data_dict)
+        return data_dict
 
     except aiohttp.ClientResponseError as err:
         message = f"""Erreur API SAUR ({url}): status: {err.status},
             message: {err.message}"""
-        raise SaurApiError(message) from err
+        raise SaurApiError(message, status=err.status) from err
     except aiohttp.ClientError as err:
         message = f"Erreur API SAUR ({url}): {err!s}"
         raise SaurApiError(message) from err
+    except TimeoutError as err:
+        message = f"Délai dépassé pour l'API SAUR ({url})"
+        raise SaurApiError(message) from err
     except json.JSONDecodeError as err:
         message = f"Erreur décodage JSON ({url}): {err!s}"
         raise SaurApiError(message) from err
 
 
+async def _stream_json_items(
+    session: aiohttp.ClientSession,
+    url: str,
+    headers: Mapping[str, str],
+    prefix: str,
+) -> AsyncIterator[Any]:
+    """Lit en GET les éléments JSON situés sous `prefix` avec ijson.
+
+    Les erreurs sont converties en SaurApiError comme dans
+    _execute_http_request. Les nombres non entiers sont décodés en
+    float, comme sans ijson.
+    """
+    # Appelée uniquement lorsque ijson est installé
+    assert ijson is not None
+    try:
+        async with session.get(
+            url, headers=headers, timeout=REQUEST_TIMEOUT
+        ) as response:
+            response.raise_for_status()
+            async for item in ijson.items_async(
+                response.content, prefix, use_float=True
+            ):
+                yield item
+    except aiohttp.ClientResponseError as err:
+        message = f"""Erreur API SAUR ({url}): status: {err.status},
+            message: {err.message}"""
+        raise SaurApiError(message, status=err.status) from err
+    except aiohttp.ClientError as err:
+        message = f"Erreur API SAUR ({url}): {err!s}"
+        raise SaurApiError(message) from err
+    except TimeoutError as err:
+        message = f"Délai dépassé pour l'API SAUR ({url})"
+        raise SaurApiError(message) from err
+    except ijson.JSONError as err:
+        message = f"Erreur décodage JSON ({url}): {err!s}"
+        raise SaurApiError(message) from err
+
+
+@lru_cache(maxsize=256)
+def _fmt_weekly(
+    template: str, section_id: str, year: int, month: int, day: int
+) -> str:
+    """Construit l'URL hebdomadaire (mémoïsée : les mêmes dates
+    reviennent à chaque interrogation)."""
+    return template % (section_id, year, month, day)
+
+
+@lru_cache(maxsize=256)
+def _fmt_monthly(template: str, section_id: str, year: int, month: int) -> str:
+    """Construit l'URL mensuelle (mémoïsée)."""
+    return template % (section_id, year, month)
+
+
 def _build_auth_payload(login: str, password: str) -> dict[str, Any]:
     """Construit le payload pour la requête d'authentification."""
     payload: dict[str, Any] = {
@@ -369,75 +1282,45 @@ def _build_auth_payload(login: str, password: str) -> dict[str, Any]:
     return payload
 
 
-def _process_auth_response(self: "SaurClient", data: dict[str, Any]) -> None:
-    """Traite la réponse d'authentification et
-    met à jour l'état de l'objet SaurClient."""
-    if (
-        data
-        and data.get("token", {}).get("access_token")
-        and data.get("defaultSectionId")
-    ):
-        self.access_token = data.get("token", {}).get("access_token")
-        self.default_section_id = str(data.get("defaultSectionId"))
-        self.clientId = str(data.get("clientId"))
-        _LOGGER.debug(
-            "Authentification réussie. Réponse: %s",
-            json.dumps(data, indent=2),  # JSON formaté avec indentation
+def _jwt_expiry(token: str) -> float | None:
+    """Retourne l'expiration (timestamp) d'un token JWT, si lisible."""
+    try:
+        claims_b64: str = token.split(".")[1]
+        claims: Any = _json_loads(
+            base64.urlsafe_b64decode(claims_b64 + "=" * (-len(claims_b64) % 4))
         )
-    else:
-        _LOGGER.error("Réponse d'authentification invalide : %s", data)
-        raise SaurApiError("L'authentification a échoué : données invalides.")
-
-
-async def _retry_authentication(
-    self: "SaurClient",
-    err: SaurApiError,
-    attempt: int,
-    max_retries: int,
-    headers: dict[str, str],
-) -> bool:
-    """Gère la ré-authentification en cas d'erreur 401 ou 403.
-
-    Args:
-        self: L'instance de SaurClient.
-        err: L'exception SaurApiError à gérer.
-        attempt: Le numéro de la tentative actuelle.
-        max_retries: Le nombre maximum de tentatives.
-        headers: Les headers de la requête (pour mise à jour du token).
-
-    Returns:
-        True si la ré-authentification a réussi et la requête
-        peut être retentée, False sinon.
-
-    Raises:
-        SaurApiError: Si le nombre maximum de tentatives est atteint
-        ou si l'erreur n'est pas une erreur 401 ou 403.
-    """
-    if "status: 401" in str(err) or "status: 403" in str(err):
-        if attempt < max_retries:
-            _LOGGER.debug(
-                "Réponse %s, tentative de ré-authentification"
-                "(tentative %s/%s).",
-                err,
-                attempt + 1,
-                max_retries,
-            )
-            # On réinitialise le token pour forcer une
-            # nouvelle authentification
-            self.access_token = None
-            await self._authenticate()
-            headers["Authorization"] = f"Bearer {self.access_token}"
+        return float(claims["exp"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
 
-            return True  # Indique que la requête peut être retentée
-        else:
-            _LOGGER.error(
-                "Réponse %s, nombre maximum de tentatives de "
-                "ré-authentification atteint.",
-                err,
-            )
-            raise SaurApiError(
-                "Nombre maximum de tentatives de ré-authentification atteint:"
-                f"{err}"
-            ) from err
-    else:
-        raise err  # On relève l'erreur si ce n'est pas une erreur 401/403
+
+def _retry_delay(
+    err: SaurApiError, attempt: int, backoff_factor: float
+) -> float:
+    """Calcule le délai avant la prochaine tentative, en secondes.
+
+    L'en-tête Retry-After de la réponse en erreur est respecté s'il est
+    présent ; sinon le délai croît exponentiellement et est multiplié
+    par un aléa entre 1 et 2, pour que des clients concurrents ne
+    retentent pas tous au même instant. Le délai est plafonné à
+    RETRY_MAX_DELAY.
+    """
+    cause: BaseException | None = err.__cause__
+    retry_after: str | None = (
+        cause.headers.get("Retry-After")
+        if isinstance(cause, aiohttp.ClientResponseError) and cause.headers
+        else None
+    )
+    if retry_after:
+        try:
+            return min(RETRY_MAX_DELAY, max(0.0, float(retry_after)))
+        except ValueError:
+            try:
+                retry_date = parsedate_to_datetime(retry_after)
+                delay: float = retry_date.timestamp() - time.time()
+                return min(RETRY_MAX_DELAY, max(0.0, delay))
+            except (TypeError, ValueError):
+                pass
+    return min(
+        RETRY_MAX_DELAY, backoff_factor**attempt * random.uniform(1.0, 2.0)
+    )
@@ -1,7 +1,17 @@
 # (generated with --quick)
 
 import logging
-from typing import Any, Coroutine, Optional
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Mapping,
+    Optional,
+)
+
+from aiohttp import ClientSession
 
 SaurResponse = dict[str, Any]
 
@@ -28,12 +38,31 @@ class SaurResponseContracts(SaurResponse):
 
 BASE_DEV: str
 BASE_SAUR: str
-ClientSession: Any
+CACHE_MAX_ENTRIES: int
+CACHE_TTL_DELIVERY: float
+CACHE_TTL_LAST: float
+CACHE_TTL_MONTHLY: float
+CACHE_TTL_WEEKLY: float
+CONNECTOR_KEEPALIVE_TIMEOUT: int
+CONNECTOR_LIMIT: int
+CONNECTOR_LIMIT_PER_HOST: int
+CONNECTOR_TTL_DNS_CACHE: int
+REQUEST_TIMEOUT: Any
+TOKEN_CACHE_MIN_VALIDITY: float
+TOKEN_REFRESH_MARGIN: float
+RETRY_AUTH_STATUSES: frozenset[int]
+RETRY_BACKOFF_ERRORS: tuple[type[BaseException], ...]
+RETRY_BACKOFF_STATUSES: frozenset[int]
+RETRY_MAX_DELAY: float
 USER_AGENT: str
 _LOGGER: logging.Logger
 
 class SaurApiError(Exception):
     __doc__: str
+    status: Optional[int]
+    def __init__(
+        self, message: str, *, status: Optional[int] = ...
+    ) -> None: ...
 
 class SaurClient:
     __doc__: str
@@ -44,15 +73,16 @@ class SaurClient:
     default_section_id: str
     delivery_url: str
     dev_mode: bool
-    headers: dict[str, str]
+    headers: Mapping[str, str]
     last_url: str
     login: str
     monthly_url: str
     password: str
-    session: type
+    session: Optional[ClientSession]
+    stale_on_error: bool
     token_url: str
     weekly_url: str
-    def __aenter__(self) -> Coroutine[Any, Any, Any]: ...
+    def __aenter__(self) -> Coroutine[Any, Any, SaurClient]: ...
     def __aexit__(
         self, exc_type: None, exc_val: None, exc_tb: None
     ) -> Coroutine[Any, Any, None]: ...
@@ -64,6 +94,11 @@ class SaurClient:
         clientId: str = ...,
         dev_mode: bool = ...,
         token: str = ...,
+        session: Optional[ClientSession] = ...,
+        connector: Any = ...,
+        stale_on_error: bool = ...,
+        shared_session: bool = ...,
+        keepalive_interval: Optional[float] = ...,
     ) -> None: ...
     def _async_request(
         self,
@@ -74,8 +109,58 @@ class SaurClient:
         backoff_factor: float = ...,
     ) -> Coroutine[Any, Any, dict[str, Any]]: ...
     def _authenticate(self) -> Coroutine[Any, Any, None]: ...
+    def _retry_authentication(
+        self,
+        err: SaurApiError,
+        attempt: int,
+        max_retries: int,
+        token_version: int,
+        *,
+        backoff_factor: float = ...,
+    ) -> Coroutine[Any, Any, bool]: ...
+    def _forget_inflight(self, url: str, task: Any) -> None: ...
+    def _send_request(
+        self,
+        method: str,
+        url: str,
+        payload: Optional[dict[str, Any]] = ...,
+        max_retries: int = ...,
+        backoff_factor: float = ...,
+    ) -> Coroutine[Any, Any, dict[str, Any]]: ...
+    def _base_request_headers(self) -> dict[str, str]: ...
+    def _update_auth_headers(self) -> None: ...
+    def _process_auth_response(self, data: dict[str, Any]) -> None: ...
+    def _store_token(
+        self, access_token: str, section_id: str, client_id: str
+    ) -> None: ...
+    def _with_auth_backoff(
+        self,
+        ensure: Callable[[], Awaitable[None]],
+        max_retries: int = ...,
+        backoff_factor: float = ...,
+    ) -> Coroutine[Any, Any, None]: ...
+    def _cached_get(
+        self, url: str, ttl: float
+    ) -> Coroutine[Any, Any, dict[str, Any]]: ...
+    def _keepalive_loop(self, interval: float) -> Coroutine[Any, Any, None]: ...
+    def _load_cached_token(self) -> None: ...
+    def _invalidate_token(self, token_version: int) -> None: ...
+    def _refresh_token(self, token_version: int) -> Coroutine[Any, Any, None]: ...
+    def _get_session(self) -> Coroutine[Any, Any, ClientSession]: ...
+    def _ensure_authenticated(self) -> Coroutine[Any, Any, None]: ...
+    def _ensure_default_section_id(self) -> Coroutine[Any, Any, None]: ...
+    def _ensure_client_id(self) -> Coroutine[Any, Any, None]: ...
+    def _ensure_fresh_token(self) -> Coroutine[Any, Any, None]: ...
+    def aclose(self) -> Coroutine[Any, Any, None]: ...
+    def bust_cache(self) -> None: ...
     def close_session(self) -> Coroutine[Any, Any, None]: ...
+    def fetch_all(
+        self, year: int, month: int, day: int, section_id: Optional[str] = ...
+    ) -> Coroutine[Any, Any, dict[str, dict[str, Any] | BaseException]]: ...
     def get_contracts(self) -> Coroutine[Any, Any, SaurResponseContracts]: ...
+    def iter_contract_clients(
+        self, max_retries: int = ..., backoff_factor: float = ...
+    ) -> AsyncIterator[dict[str, Any]]: ...
     def get_deliverypoints_data(
         self, section_id: Optional[str] = ...
     ) -> Coroutine[Any, Any, SaurResponseDelivery]: ...
@@ -89,19 +174,29 @@ class SaurClient:
         self, year: int, month: int, day: int, section_id: Optional[str] = ...
     ) -> Coroutine[Any, Any, SaurResponseWeekly]: ...
 
+def _fmt_monthly(template: str, section_id: str, year: int, month: int) -> str: ...
+def _fmt_weekly(
+    template: str, section_id: str, year: int, month: int, day: int
+) -> str: ...
+def _new_connector() -> Any: ...
+def _get_shared_session() -> Coroutine[Any, Any, ClientSession]: ...
+def close_shared_session() -> Coroutine[Any, Any, None]: ...
 def _build_auth_payload(login: str, password: str) -> dict[str, Any]: ...
 def _execute_http_request(
-    session,
+    session: ClientSession,
     method: str,
     url: str,
-    headers: dict[str, str],
-    payload: Optional[dict[str, Any]] = ...,
+    headers: Mapping[str, str],
+    *,
+    payload: Optional[dict[str, Any] | bytes] = ...,
 ) -> Coroutine[Any, Any, dict[str, Any]]: ...
-def _process_auth_response(self: SaurClient, data: dict[str, Any]) -> None: ...
-def _retry_authentication(
-    self: SaurClient,
-    err: SaurApiError,
-    attempt: int,
-    max_retries: int,
-    headers: dict[str, str],
-) -> Coroutine[Any, Any, bool]: ...
+def _stream_json_items(
+    session: ClientSession,
+    url: str,
+    headers: Mapping[str, str],
+    prefix: str,
+) -> AsyncIterator[Any]: ...
+def _json_dumps(obj: Any) -> bytes: ...
+def _json_serialize(obj: Any) -> str: ...
+def _jwt_expiry(token: str) -> Optional[float]: ...
+def _retry_delay(err: Any, attempt: int, backoff_factor: float) -> float: ...
@@ -1,11 +1,12 @@
 import asyncio
-import json
 import logging
+import os
 import sys
+from collections.abc import AsyncIterable, AsyncIterator
 from dataclasses import dataclass
 from pprint import pprint
 
-import aiofiles
+import orjson
 
 from saur_client import SaurClient
 
@@ -18,6 +19,8 @@ logging.basicConfig(
 _LOGGER = logging.getLogger(__name__)
 _LOGGER.setLevel(logging.DEBUG)
 
+CREDENTIALS_FILE = "credentials.json"
+
 
 @dataclass(frozen=True, slots=True)
 class SectionSubscriptionData:
@@ -27,66 +30,93 @@ class SectionSubscriptionData:
     isContractTerminated: bool
 
 
-def extract_subscription_data(
-    json_data: dict,
-) -> list[SectionSubscriptionData]:
+def _is_true(value: object) -> bool:
+    """Interprète un booléen JSON, ou sa forme texte ("True", "true")."""
+    if isinstance(value, bool):
+        return value
+    return str(value).lower() == "true"
+
+
+async def extract_subscription_data(
+    clients: AsyncIterable[dict],
+) -> AsyncIterator[SectionSubscriptionData]:
     """
     Extrait les informations des abonnements de section
-    (SectionSubscriptionData) à partir d'un JSON donné.
+    (SectionSubscriptionData) au fil des clients reçus.
 
     Args:
-        json_data (Dict): Le JSON contenant les données des clients,
-            contrats, et abonnements.
+        clients (AsyncIterable[Dict]): Les clients de la réponse des
+            contrats, avec leurs comptes et abonnements, par exemple
+            SaurClient.iter_contract_clients().
 
-    Returns:
-        list[SectionSubscriptionData]: Une liste
-        d'objets SectionSubscriptionData."""
+    Yields:
+        SectionSubscriptionData: Un objet par abonnement, dès que le
+        client correspondant est lu."""
 
-    subscription_list: list[SectionSubscriptionData] = []
-
-    for client in json_data.get("clients", []):
+    # Des tuples vides (partagés) comme valeurs par défaut
+    async for client in clients:
         client_reference = client.get("clientReference", "")
         contract_name = client.get("contractName", "")
-
-        for account in client.get("customerAccounts", []):
-            for subscription in account.get("sectionSubscriptions", []):
-                subscription_data = SectionSubscriptionData(
+        for account in client.get("customerAccounts", ()):
+            for subscription in account.get("sectionSubscriptions", ()):
+                yield SectionSubscriptionData(
                     clientReference=client_reference,
                     contractName=contract_name,
                     sectionSubscriptionId=subscription.get(
                         "sectionSubscriptionId", ""
                     ),
-                    isContractTerminated=subscription.get(
-                        "isContractTerminated", False
-                    )
-                    == "True",  # Conversion en booléen
+                    isContractTerminated=_is_true(
+                        subscription.get("isContractTerminated", False)
+                    ),
                 )
-                subscription_list.append(subscription_data)
 
-    return subscription_list
+
+def read_credentials(path: str) -> bytes:
+    """Lit le fichier d'identifiants en bytes, sans couche io Python."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        chunks: list[bytes] = []
+        while chunk := os.read(fd, 65536):
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    return b"".join(chunks)
+
+
+def write_credentials(path: str, data: bytes) -> None:
+    """Écrit le fichier d'identifiants en remplaçant son contenu."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
 
 
 try:
-    with open("credentials.json") as f:
-        credentials = json.load(f)
-        login = credentials.get("login")
-        password = credentials.get("mdp")
-        token = credentials.get("token", "")
-        unique_id = credentials.get("unique_id", "")
-        client_id = credentials.get("clientId", "")
-        _LOGGER.debug(f"\ntoken in json : {token}\n")
-
-        if not login or not password:
-            raise ValueError(
-                "Le fichier credentials.json doit contenir 'login' et 'mdp'."
-            )
+    credentials = orjson.loads(read_credentials(CREDENTIALS_FILE))
+    login = credentials.get("login")
+    password = credentials.get("mdp")
+    token = credentials.get("token", "")
+    unique_id = credentials.get("unique_id", "")
+    client_id = credentials.get("clientId", "")
+    # État enregistré, comparé en fin d'authentification pour n'écrire le
+    # fichier que s'il a changé
+    stored_state = (token, unique_id, client_id)
+    _LOGGER.debug("\ntoken in json : %s\n", token)
+
+    if not login or not password:
+        raise ValueError(
+            "Le fichier credentials.json doit contenir 'login' et 'mdp'."
+        )
 
 except FileNotFoundError:
     print("Le fichier credentials.json est introuvable.")
     print("Créez un fichier credentials.json avec la structure suivante :")
     print('{"login": "votre_login", "mdp": "votre_mot_de_passe"}')
     sys.exit()
-except (json.JSONDecodeError, ValueError) as e:
+except (orjson.JSONDecodeError, ValueError) as e:
     print(f"Erreur lors de la lecture du fichier credentials.json : {e}")
     print(
         'Le fichier doit avoir la structure suivante : {'
@@ -103,33 +133,51 @@ async def main():
             password=password,
             token=token,
             unique_id=unique_id,
+            clientId=client_id,
             dev_mode=True,
         )
         delivery_points = await client.get_deliverypoints_data()
 
-        credentials["token"] = client.access_token
-        credentials["unique_id"] = client.default_section_id
-        credentials["clientId"] = client.clientId
+        new_state = (
+            client.access_token,
+            client.default_section_id,
+            client.clientId,
+        )
+        (
+            credentials["token"],
+            credentials["unique_id"],
+            credentials["clientId"],
+        ) = new_state
         sectionid = client.default_section_id
 
-        async with aiofiles.open("credentials.json", "w") as f:
-            await f.write(json.dumps(credentials, indent=4))
+        credentials_json = orjson.dumps(credentials, option=orjson.OPT_INDENT_2)
+        if new_state != stored_state:
+            await asyncio.to_thread(
+                write_credentials, CREDENTIALS_FILE, credentials_json
+            )
         print("****************************")
-        chaine_json = json.dumps(credentials, indent=4)
+        chaine_json = credentials_json.decode()
         pprint(chaine_json)
         pprint(delivery_points)
         print("****************************")
-        delivery_points = await client.get_contracts()
-        subscription_data = extract_subscription_data(delivery_points)
+        # Le client est authentifié : les lectures indépendantes sont
+        # lancées en parallèle sur le pool de connexions, pendant que les
+        # abonnements sont affichés au fil de la réponse des contrats
+        readings = asyncio.gather(
+            client.get_monthly_data(2025, 2, sectionid),
+            client.get_weekly_data(2024, 9, 1, sectionid),
+            client.get_lastknown_data(sectionid),
+        )
         print("****************************")
-        pprint(subscription_data)
+        async for subscription_data in extract_subscription_data(
+            client.iter_contract_clients()
+        ):
+            pprint(subscription_data)
         print("****************************")
-        delivery_points = await client.get_monthly_data(2025, 2)
-        delivery_points = await client.get_monthly_data(2025, 2, sectionid)
-        delivery_points = await client.get_weekly_data(2024, 9, 1)
-        delivery_points = await client.get_weekly_data(2024, 9, 1, sectionid)
-        delivery_points = await client.get_lastknown_data()
-        delivery_points = await client.get_lastknown_data(sectionid)
+        monthly, weekly, lastknown = await readings
+        pprint(monthly)
+        pprint(weekly)
+        pprint(lastknown)
 
     except Exception as e:
         print(f"Une erreur est survenue : {e}")